@@ -2,20 +2,592 @@
 Educational Resources Component - Learning materials and guides for DoS attack education
 """
 
+import bisect
+import datetime
+import functools
+from enum import IntEnum
+import re
+import textwrap
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 from data.dos_attacks_database import DoSAttackDatabase
 
+try:
+    import markdown as _markdown
+except ImportError:
+    _markdown = None
+
+# Static guide content - built once at import instead of on every rerun
+_DETECTION_STEPS = (
+    {
+        'title': 'Baseline Establishment',
+        'description': 'Establish normal traffic patterns and system behavior',
+        'tasks': (
+            'Monitor traffic for 2-4 weeks during normal operations',
+            'Document peak usage times and patterns',
+            'Record normal resource utilization levels',
+            'Identify legitimate traffic sources and patterns'
+        ),
+        'tools': ('Network monitoring tools', 'SIEM systems', 'Traffic analyzers'),
+        'metrics': ('Requests per second', 'Bandwidth utilization', 'Connection counts')
+    },
+    {
+        'title': 'Threshold Configuration',
+        'description': 'Set appropriate detection thresholds based on baseline data',
+        'tasks': (
+            'Calculate baseline statistics (mean, standard deviation)',
+            'Set thresholds at 3-4 standard deviations above normal',
+            'Configure rate-based detection rules',
+            'Implement adaptive thresholds for time-of-day variations'
+        ),
+        'tools': ('Statistical analysis tools', 'Threshold calculators', 'Alert systems'),
+        'metrics': ('Threshold values', 'False positive rates', 'Detection sensitivity')
+    },
+    {
+        'title': 'Detection Rules',
+        'description': 'Implement comprehensive detection rules and signatures',
+        'tasks': (
+            'Create traffic volume detection rules',
+            'Implement protocol-specific signatures',
+            'Configure behavioral analysis rules',
+            'Set up geographic anomaly detection'
+        ),
+        'tools': ('IDS/IPS systems', 'Rule engines', 'Signature databases'),
+        'metrics': ('Rule coverage', 'Detection accuracy', 'Response time')
+    }
+)
+
+_RESPONSE_PHASES = {
+    'Detection & Analysis': {
+        'duration': '5-15 minutes',
+        'activities': (
+            'Confirm attack detection',
+            'Classify attack type and severity',
+            'Assess immediate impact',
+            'Activate incident response team'
+        ),
+        'tools': ('Monitoring dashboards', 'Alert systems', 'Analysis tools'),
+        'decisions': (
+            'Is this a confirmed DoS attack?',
+            'What is the attack severity level?',
+            'Which systems are affected?'
+        )
+    },
+    'Containment': {
+        'duration': '15-30 minutes',
+        'activities': (
+            'Implement traffic filtering',
+            'Activate DDoS protection services',
+            'Block malicious sources',
+            'Reroute traffic if necessary'
+        ),
+        'tools': ('Firewalls', 'DDoS protection', 'Load balancers'),
+        'decisions': (
+            'Should we block specific IP ranges?',
+            'Do we need to activate cloud protection?',
+            'Should traffic be rerouted?'
+        )
+    },
+    'Eradication': {
+        'duration': '30-60 minutes',
+        'activities': (
+            'Eliminate attack sources',
+            'Patch vulnerabilities',
+            'Update security rules',
+            'Strengthen defenses'
+        ),
+        'tools': ('Security tools', 'Patch management', 'Configuration tools'),
+        'decisions': (
+            'Are all attack vectors eliminated?',
+            'Do we need immediate patches?',
+            'What rules need updating?'
+        )
+    },
+    'Recovery': {
+        'duration': '1-4 hours',
+        'activities': (
+            'Restore affected services',
+            'Verify system integrity',
+            'Monitor for attack resumption',
+            'Communicate with stakeholders'
+        ),
+        'tools': ('Backup systems', 'Monitoring tools', 'Communication systems'),
+        'decisions': (
+            'Are services fully operational?',
+            'Is monitoring adequate?',
+            'When to communicate all-clear?'
+        )
+    }
+}
+
+_HARDENING_CATEGORIES = {
+    'Network Perimeter': (
+        'Configure firewall rules to block unnecessary traffic',
+        'Implement ingress and egress filtering',
+        'Set up intrusion detection/prevention systems',
+        'Enable DDoS protection services'
+    ),
+    'Rate Limiting': (
+        'Configure connection rate limits',
+        'Implement bandwidth throttling',
+        'Set up request rate limiting',
+        'Configure concurrent connection limits'
+    ),
+    'Protocol Security': (
+        'Disable unnecessary network services',
+        'Secure routing protocols',
+        'Implement source address validation',
+        'Configure protocol-specific protections'
+    ),
+    'Monitoring & Logging': (
+        'Enable comprehensive network logging',
+        'Set up real-time monitoring',
+        'Configure automated alerting',
+        'Implement traffic analysis tools'
+    )
+}
+
+# Memoized note bodies keyed by (module, section) - content is static, so
+# repeat downloads skip the string assembly entirely
+_NOTES_CACHE = {}
+
+_MONITORING_TASKS = (
+    "Install network monitoring software",
+    "Configure SNMP monitoring for devices",
+    "Set up traffic flow analysis",
+    "Implement log collection and analysis",
+    "Configure real-time alerting",
+    "Create monitoring dashboards",
+    "Test alert mechanisms",
+    "Document monitoring procedures"
+)
+
+_LEARNING_MODULES = {
+    'DoS Fundamentals': {
+        'description': 'Introduction to Denial of Service attacks',
+        'duration': '2 hours',
+        'sections': {
+            'What are DoS Attacks?': {
+                'type': 'text',
+                'objectives': [
+                    'Understand the definition and purpose of DoS attacks',
+                    'Distinguish between DoS and DDoS attacks',
+                    'Identify common attack motivations'
+                ],
+                'content': """
+                **Denial of Service (DoS) Attacks Overview**
+                
+                A Denial of Service attack is a malicious attempt to disrupt the normal traffic of a targeted server, 
+                service, or network by overwhelming the target or its surrounding infrastructure with a flood of Internet traffic.
+                
+                **Key Characteristics:**
+                - Designed to make services unavailable to legitimate users
+                - Can target network bandwidth, system resources, or application logic
+                - Range from simple to highly sophisticated attacks
+                
+                **DoS vs DDoS:**
+                - **DoS**: Attack from a single source
+                - **DDoS**: Distributed attack from multiple sources (more common and effective)
+                
+                **Common Motivations:**
+                - Financial gain (extortion, competitive advantage)
+                - Political activism (hacktivism)
+                - Personal grievances
+                - Testing and research (educational/defensive)
+                """,
+                'key_concepts': {
+                    'Availability': 'One of the CIA triad - ensuring services remain accessible to authorized users',
+                    'Traffic Flood': 'Overwhelming a target with more requests than it can handle',
+                    'Resource Exhaustion': 'Consuming system resources like CPU, memory, or network connections'
+                },
+                'practice_questions': [
+                    {
+                        'question': 'What is the main goal of a DoS attack?',
+                        'options': ['Steal data', 'Make services unavailable', 'Gain system access', 'Install malware'],
+                        'correct_answer': 'Make services unavailable',
+                        'explanation': 'DoS attacks specifically aim to deny service availability to legitimate users.'
+                    }
+                ]
+            },
+            'Attack Categories': {
+                'type': 'visualization',
+                'objectives': [
+                    'Classify different types of DoS attacks',
+                    'Understand attack vector characteristics',
+                    'Identify appropriate defenses for each category'
+                ],
+                'content': {
+                    'chart_type': 'attack_taxonomy'
+                }
+            },
+            'Defense Strategies': {
+                'type': 'visualization',
+                'objectives': [
+                    'Learn defense-in-depth approaches',
+                    'Understand layered security models',
+                    'Evaluate defense effectiveness'
+                ],
+                'content': {
+                    'chart_type': 'defense_layers'
+                }
+            }
+        }
+    },
+    'Attack Vectors': {
+        'description': 'Detailed study of DoS attack methodologies',
+        'duration': '3 hours',
+        'sections': {
+            'Volumetric Attacks': {
+                'type': 'text',
+                'content': """
+                **Volumetric Attacks Overview**
+                
+                Volumetric attacks aim to overwhelm the target's bandwidth or consume network resources.
+                These attacks focus on generating high volumes of traffic to saturate network links.
+                
+                **Common Types:**
+                - UDP Floods
+                - ICMP Floods  
+                - Amplification attacks (DNS, NTP, Memcached)
+                
+                **Characteristics:**
+                - High bandwidth consumption
+                - Network infrastructure targeting
+                - Measurable in bits per second (bps)
+                """,
+                'key_concepts': {
+                    'Bandwidth Saturation': 'Filling network pipes with malicious traffic',
+                    'Amplification Factor': 'Ratio of response size to request size in reflection attacks'
+                }
+            }
+        }
+    }
+}
+    
+_QUIZ_QUESTIONS = {
+    'quick_quiz': [
+        {
+            'question': 'Which type of DoS attack uses multiple compromised systems?',
+            'options': ['DoS', 'DDoS', 'UDP Flood', 'SYN Flood'],
+            'correct_answer': 'DDoS',
+            'explanation': 'DDoS (Distributed Denial of Service) attacks use multiple compromised systems to attack a target.'
+        },
+        {
+            'question': 'What is the primary goal of rate limiting as a defense mechanism?',
+            'options': ['Block all traffic', 'Control request frequency', 'Encrypt traffic', 'Monitor logs'],
+            'correct_answer': 'Control request frequency',
+            'explanation': 'Rate limiting controls the frequency of requests to prevent system overload.'
+        },
+        {
+            'question': 'Which attack vector targets the TCP handshake process?',
+            'options': ['UDP Flood', 'SYN Flood', 'HTTP Flood', 'ICMP Flood'],
+            'correct_answer': 'SYN Flood',
+            'explanation': 'SYN Flood attacks exploit the TCP three-way handshake by sending many SYN requests without completing the handshake.'
+        }
+    ]
+}
+    
+_PRACTICAL_EXERCISES = {
+    'Traffic Analysis': {
+        'title': 'Network Traffic Analysis Exercise',
+        'description': 'Learn to identify DoS attack patterns in network traffic',
+        'objectives': [
+            'Analyze network traffic patterns',
+            'Identify anomalous behavior',
+            'Calculate baseline metrics'
+        ],
+        'steps': [
+            {
+                'title': 'Establish Baseline',
+                'instruction': 'Calculate normal traffic baseline from sample data',
+                'code': '''
+# Sample traffic analysis
+import pandas as pd
+import numpy as np
+
+# Load traffic data
+traffic_data = pd.read_csv('traffic_sample.csv')
+
+# Calculate baseline metrics
+baseline_rps = traffic_data['requests_per_second'].mean()
+baseline_std = traffic_data['requests_per_second'].std()
+
+print(f"Baseline RPS: {baseline_rps:.2f}")
+print(f"Standard Deviation: {baseline_std:.2f}")
+print(f"Upper threshold: {baseline_rps + 3*baseline_std:.2f}")
+                ''',
+                'language': 'python'
+            },
+            {
+                'title': 'Anomaly Detection',
+                'instruction': 'Implement simple anomaly detection algorithm'
+            }
+        ]
+    }
+}
+
+# Dedent the triple-quoted markdown bodies once at import so reruns and
+# note exports see clean text
+for _module in _LEARNING_MODULES.values():
+    for _section in _module['sections'].values():
+        if isinstance(_section.get('content'), str):
+            _section['content'] = textwrap.dedent(_section['content'])
+del _module, _section
+
+
+_SCENARIOS = (
+    {
+        'title': 'E-commerce Site Under Attack',
+        'description': 'Your e-commerce website is experiencing a sudden 10x increase in traffic during Black Friday sales.',
+        'context': 'Peak shopping day, high legitimate traffic expected, revenue critical',
+        'indicators': ['Response time degradation', 'Database connection timeouts', 'Payment processing failures'],
+        'questions': [
+            'How would you differentiate between legitimate shopping traffic and a DoS attack?',
+            'What immediate actions would you take to maintain service availability?',
+            'How would you communicate with customers during the incident?'
+        ]
+    },
+    {
+        'title': 'Financial Services DDoS',
+        'description': 'A banking application is under a sophisticated DDoS attack affecting online banking services.',
+        'context': 'Critical financial services, regulatory compliance required, customer trust at stake',
+        'indicators': ['Login failures', 'Transaction timeouts', 'Mobile app connectivity issues'],
+        'questions': [
+            'What are your priorities for service restoration?',
+            'How would you handle regulatory reporting requirements?',
+            'What communication strategy would you implement?'
+        ]
+    }
+)
+_SCENARIOS_BY_TITLE = {s['title']: s for s in _SCENARIOS}
+_SCENARIO_TITLES = tuple(_SCENARIOS_BY_TITLE)
+
+
+_FEEDBACK_MAP = {
+    'differentiate': 'Consider analyzing traffic patterns, source IP distributions, and user behavior patterns to distinguish legitimate from malicious traffic.',
+    'immediate actions': 'Focus on preserving critical functionality, implementing traffic controls, and activating incident response procedures.',
+    'communication': 'Develop clear, honest communication that maintains customer confidence while providing necessary information.'
+}
+_FEEDBACK_RE = re.compile('|'.join(map(re.escape, _FEEDBACK_MAP)), re.IGNORECASE)
+_DEFAULT_FEEDBACK = 'Good analysis. Consider the technical, business, and communication aspects of your response.'
+
+
+_STANDARDS = {
+    'NIST Cybersecurity Framework': {
+        'description': 'Framework for improving critical infrastructure cybersecurity',
+        'relevance': 'Identify, Protect, Detect, Respond, Recover phases for DoS incidents',
+        'link': 'https://www.nist.gov/cyberframework'
+    },
+    'ISO 27001': {
+        'description': 'Information security management systems standard',
+        'relevance': 'Risk management and security controls for DoS protection',
+        'link': 'https://www.iso.org/isoiec-27001-information-security.html'
+    },
+    'OWASP Security Guidelines': {
+        'description': 'Open Web Application Security Project guidelines',
+        'relevance': 'Application-layer DoS protection and mitigation techniques',
+        'link': 'https://owasp.org/'
+    }
+}
+
+_BEST_PRACTICES = {
+    'Prevention': (
+        'Implement network segmentation and access controls',
+        'Use rate limiting and traffic shaping',
+        'Deploy DDoS protection services',
+        'Regular security assessments and penetration testing'
+    ),
+    'Detection': (
+        'Establish baseline traffic patterns',
+        'Implement real-time monitoring and alerting',
+        'Use behavioral analysis and anomaly detection',
+        'Deploy intrusion detection/prevention systems'
+    ),
+    'Response': (
+        'Develop and test incident response procedures',
+        'Maintain communication plans and contact lists',
+        'Practice regular incident response drills',
+        'Document all incidents for lessons learned'
+    ),
+    'Recovery': (
+        'Implement robust backup and recovery procedures',
+        'Test disaster recovery plans regularly',
+        'Maintain business continuity plans',
+        'Conduct post-incident reviews and improvements'
+    )
+}
+
+_TOOLS = {
+    'Open Source': (
+        'Wireshark - Network protocol analyzer',
+        'Nagios - Network monitoring',
+        'Suricata - Network IDS/IPS',
+        'pfSense - Firewall and router'
+    ),
+    'Commercial': (
+        'Cloudflare - DDoS protection service',
+        'Arbor Networks - DDoS protection',
+        'F5 - Application delivery controllers',
+        'Radware - DDoS protection solutions'
+    ),
+    'Cloud Services': (
+        'AWS Shield - DDoS protection',
+        'Azure DDoS Protection - Microsoft cloud protection',
+        'Google Cloud Armor - Google cloud security',
+        'Cloudflare - Global DDoS protection'
+    )
+}
+
+_GLOSSARY = {
+    'DDoS': 'Distributed Denial of Service - attack using multiple compromised systems',
+    'Botnet': 'Network of compromised computers controlled remotely',
+    'Amplification': 'Attack technique that leverages servers to multiply attack traffic',
+    'Rate Limiting': 'Controlling the rate of requests to prevent overload',
+    'SYN Flood': 'Attack that exploits TCP handshake process',
+    'Volumetric Attack': 'Attack designed to consume bandwidth or system resources',
+    'Protocol Attack': 'Attack that exploits weaknesses in network protocols',
+    'Application Layer Attack': 'Attack targeting specific applications or services'
+}
+
+
+@st.cache_data
+def _standards_md():
+    parts = ["### 📋 Standards & Frameworks"]
+    for standard, info in _STANDARDS.items():
+        parts.append(
+            f"<details><summary>{standard}</summary>"
+            f"<p><b>Description</b>: {info['description']}<br>"
+            f"<b>DoS Relevance</b>: {info['relevance']}<br>"
+            f"<b>Reference</b>: {info['link']}</p></details>"
+        )
+    return "\n".join(parts)
+
+
+@st.cache_data
+def _best_practices_md():
+    parts = ["### ✅ Best Practices"]
+    for category, practices in _BEST_PRACTICES.items():
+        parts.append(f"**{category}**")
+        parts.append("\n".join(f"- {practice}" for practice in practices))
+        parts.append("---")
+    return "\n\n".join(parts)
+
+
+@st.cache_data
+def _tools_md():
+    parts = ["### 🛠️ Tools & Resources"]
+    for category, tool_list in _TOOLS.items():
+        parts.append(f"**{category} Tools**")
+        parts.append("\n".join(f"- {tool}" for tool in tool_list))
+        parts.append("---")
+    return "\n\n".join(parts)
+
+
+@st.cache_data
+def _glossary_md():
+    parts = ["### 📖 Glossary"]
+    parts.extend(
+        f"<details><summary>{term}</summary><p>{definition}</p></details>"
+        for term, definition in _GLOSSARY.items()
+    )
+    return "\n".join(parts)
+
+
+# Score thresholds for grading, sorted for bisect lookup
+_GRADE_TABLE = (
+    (60, "Needs Improvement", "red"),
+    (70, "Fair", "orange"),
+    (80, "Good", "blue"),
+    (101, "Excellent", "green")
+)
+_GRADE_THRESHOLDS = tuple(row[0] for row in _GRADE_TABLE)
+
+
+# Assessment levels as IntEnums: label strings are mapped to ordered
+# values at the widget, so recommendation logic compares integers instead
+# of scanning substrings
+class NetworkSize(IntEnum):
+    SMALL = 1
+    MEDIUM = 2
+    LARGE = 3
+
+
+class TrafficVolume(IntEnum):
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    VERY_HIGH = 4
+
+
+class Criticality(IntEnum):
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+
+_NETWORK_SIZE_LABELS = {
+    "Small (< 100 devices)": NetworkSize.SMALL,
+    "Medium (100-1000 devices)": NetworkSize.MEDIUM,
+    "Large (1000+ devices)": NetworkSize.LARGE
+}
+
+_TRAFFIC_VOLUME_LABELS = {
+    "Low (< 1GB)": TrafficVolume.LOW,
+    "Medium (1-10GB)": TrafficVolume.MEDIUM,
+    "High (10-100GB)": TrafficVolume.HIGH,
+    "Very High (> 100GB)": TrafficVolume.VERY_HIGH
+}
+
+_CRITICALITY_LABELS = {
+    "Low": Criticality.LOW,
+    "Medium": Criticality.MEDIUM,
+    "High": Criticality.HIGH,
+    "Critical": Criticality.CRITICAL
+}
+
+
+# Recommendation rules as (predicate, text) pairs; results are cached
+# tuples keyed by the assessment triple
+_MONITORING_RULES = (
+    (lambda n, t, c: n is NetworkSize.LARGE,
+     "Deploy distributed monitoring infrastructure"),
+    (lambda n, t, c: n is NetworkSize.LARGE,
+     "Implement centralized log aggregation"),
+    (lambda n, t, c: t >= TrafficVolume.HIGH,
+     "Use high-performance monitoring tools"),
+    (lambda n, t, c: t >= TrafficVolume.HIGH,
+     "Implement traffic sampling for analysis"),
+    (lambda n, t, c: c >= Criticality.HIGH,
+     "Set up 24/7 monitoring with immediate alerting"),
+    (lambda n, t, c: c >= Criticality.HIGH,
+     "Implement redundant monitoring systems")
+)
+
+
 class EducationalResources:
     def __init__(self):
         self.db = DoSAttackDatabase()
         self.learning_modules = self._get_learning_modules()
         self.quiz_questions = self._get_quiz_questions()
         self.practical_exercises = self._get_practical_exercises()
+        # Precomputed selectbox options - avoids rebuilding lists on every rerun
+        self.module_names = tuple(self.learning_modules)
+        self.module_sections = {
+            name: tuple(data['sections'])
+            for name, data in self.learning_modules.items()
+        }
+        self.exercise_names = tuple(self.practical_exercises)
+        # Pre-render long text sections to HTML once so reruns skip the
+        # Markdown parse; falls back to st.markdown when the markdown
+        # package is unavailable
+        if _markdown is not None:
+            for data in self.learning_modules.values():
+                for section_data in data['sections'].values():
+                    if isinstance(section_data.get('content'), str):
+                        section_data['_html'] = _markdown.markdown(section_data['content'])
     
     def render(self):
         st.header("📖 Educational Resources")
@@ -49,25 +621,23 @@ class EducationalResources:
         with col1:
             st.markdown("**Available Modules**")
             
-            module_names = list(self.learning_modules.keys())
-            selected_module = st.selectbox("Select Module", module_names)
-            
-            # Module progress tracking
-            if 'module_progress' not in st.session_state:
-                st.session_state.module_progress = {}
+            selected_module = st.selectbox("Select Module", self.module_names)
             
-            current_progress = st.session_state.module_progress.get(selected_module, 0)
+            # Module progress tracking - completed sections are recorded by
+            # name, so progress is exact integer math with no float drift
+            st.session_state.setdefault('completed_sections', {})
+
+            completed = st.session_state.completed_sections.get(selected_module, ())
+            current_progress = len(completed) * 100 // len(self.module_sections[selected_module])
             st.progress(current_progress / 100, f"Progress: {current_progress}%")
             
             # Module navigation
             st.markdown("---")
             st.markdown("**Module Navigation**")
             
-            if selected_module in self.learning_modules:
-                module_data = self.learning_modules[selected_module]
-                sections = list(module_data['sections'].keys())
-                
-                selected_section = st.selectbox("Select Section", sections)
+            selected_section = st.selectbox(
+                "Select Section", self.module_sections[selected_module]
+            )
         
         with col2:
             if selected_module and selected_section:
@@ -90,7 +660,10 @@ class EducationalResources:
         content_type = section_data.get('type', 'text')
         
         if content_type == 'text':
-            st.markdown(section_data['content'])
+            if '_html' in section_data:
+                st.html(section_data['_html'])
+            else:
+                st.markdown(section_data['content'])
         
         elif content_type == 'interactive':
             self._render_interactive_content(section_data)
@@ -112,19 +685,27 @@ class EducationalResources:
             st.markdown("---")
             st.markdown("**Practice Questions**")
             
-            for i, question in enumerate(section_data['practice_questions']):
-                with st.expander(f"Question {i+1}: {question['question']}"):
-                    user_answer = st.radio(
+            # Batch all questions in one form so a single submit reruns once
+            # instead of one full rerun per answer checked
+            with st.form(f"practice_{module_name}_{section_name}"):
+                qprefix = f"q_{module_name}_{section_name}_"
+                user_answers = []
+                for i, question in enumerate(section_data['practice_questions']):
+                    st.markdown(f"**Question {i+1}**: {question['question']}")
+                    user_answers.append(st.radio(
                         "Select your answer:",
                         question['options'],
-                        key=f"q_{module_name}_{section_name}_{i}"
-                    )
-                    
-                    if st.button(f"Check Answer", key=f"check_{module_name}_{section_name}_{i}"):
-                        if user_answer == question['correct_answer']:
-                            st.success("✅ Correct! " + question['explanation'])
-                        else:
-                            st.error("❌ Incorrect. " + question['explanation'])
+                        key=qprefix + str(i)
+                    ))
+
+                submitted = st.form_submit_button("Check All Answers")
+
+            if submitted:
+                for question, user_answer in zip(section_data['practice_questions'], user_answers):
+                    if user_answer == question['correct_answer']:
+                        st.success("✅ Correct! " + question['explanation'])
+                    else:
+                        st.error("❌ Incorrect. " + question['explanation'])
         
         # Section completion
         st.markdown("---")
@@ -132,26 +713,24 @@ class EducationalResources:
         
         with col1:
             if st.button("Mark Section Complete", key=f"complete_{module_name}_{section_name}"):
-                # Update progress
-                total_sections = len(module_data['sections'])
-                progress_increment = 100 / total_sections
-                
-                current_progress = st.session_state.module_progress.get(module_name, 0)
-                new_progress = min(100, current_progress + progress_increment)
-                st.session_state.module_progress[module_name] = new_progress
-                
+                # Record the section by name - idempotent, so re-clicking
+                # cannot inflate progress past 100%
+                st.session_state.completed_sections.setdefault(module_name, set()).add(section_name)
+
                 st.success("Section marked as complete!")
                 st.rerun()
         
         with col2:
-            if st.button("Download Section Notes", key=f"download_{module_name}_{section_name}"):
-                notes = self._generate_section_notes(module_name, section_name, section_data)
-                st.download_button(
-                    label="Download Notes",
-                    data=notes,
-                    file_name=f"{module_name}_{section_name}_notes.txt",
-                    mime="text/plain"
-                )
+            # Single widget: the old button-then-download_button pattern needed
+            # an extra rerun just to reveal the download link
+            st.download_button(
+                label="Download Section Notes",
+                data=self._generate_section_notes(module_name, section_name, section_data),
+                file_name=f"{module_name}_{section_name}_notes.txt",
+                mime="text/plain",
+                on_click="ignore",
+                key=f"download_{module_name}_{section_name}"
+            )
     
     def _render_interactive_content(self, section_data):
         """Render interactive learning content"""
@@ -174,53 +753,42 @@ class EducationalResources:
                     defense_level = st.slider("Defense Level", 1, 10, 5, key="sim_defense")
                     response_time = st.slider("Response Time (minutes)", 1, 30, 5, key="sim_response")
                 
-                # Generate simulation data
-                time_points = list(range(0, attack_duration + 1))
-                attack_power = [min(10, attack_intensity * (1 + 0.1 * t)) for t in time_points]
-                
-                # Apply defense
-                defense_effectiveness = []
-                for t in time_points:
-                    if t >= response_time:
-                        effectiveness = min(attack_power[t], defense_level * (t - response_time + 1) * 0.2)
-                        defense_effectiveness.append(effectiveness)
-                    else:
-                        defense_effectiveness.append(0)
-                
-                system_health = [max(0, 100 - (attack_power[t] - defense_effectiveness[t]) * 10) for t in time_points]
-                
-                # Visualization
-                fig = go.Figure()
-                
-                fig.add_trace(go.Scatter(
-                    x=time_points, y=attack_power,
-                    mode='lines+markers', name='Attack Power',
-                    line=dict(color='red', width=3)
-                ))
-                
-                fig.add_trace(go.Scatter(
-                    x=time_points, y=defense_effectiveness,
-                    mode='lines+markers', name='Defense Effectiveness',
-                    line=dict(color='blue', width=3)
-                ))
-                
-                fig.add_trace(go.Scatter(
-                    x=time_points, y=system_health,
-                    mode='lines+markers', name='System Health %',
-                    line=dict(color='green', width=3),
-                    yaxis='y2'
-                ))
-                
-                fig.update_layout(
-                    title='Attack vs Defense Simulation',
-                    xaxis_title='Time (minutes)',
-                    yaxis_title='Power/Effectiveness',
-                    yaxis2=dict(title='System Health %', overlaying='y', side='right'),
-                    height=400
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+                # Generate simulation data - branchless NumPy expressions
+                time_points = np.arange(attack_duration + 1)
+                attack_power = np.minimum(10, attack_intensity * (1 + 0.1 * time_points))
+
+                # Apply defense: ramps from zero once response time is reached,
+                # capped at the attack power it is countering
+                eff_raw = defense_level * np.maximum(0, time_points - response_time + 1) * 0.2
+                defense_effectiveness = np.minimum(attack_power, eff_raw)
+
+                system_health = np.maximum(0, 100 - (attack_power - defense_effectiveness) * 10)
                 
+                # Visualization - single dict spec avoids per-trace validation passes
+                fig = go.Figure({
+                    'data': [
+                        {'type': 'scattergl', 'x': time_points, 'y': attack_power,
+                         'mode': 'lines+markers', 'name': 'Attack Power',
+                         'line': {'color': 'red', 'width': 3}},
+                        {'type': 'scattergl', 'x': time_points, 'y': defense_effectiveness,
+                         'mode': 'lines+markers', 'name': 'Defense Effectiveness',
+                         'line': {'color': 'blue', 'width': 3}},
+                        {'type': 'scattergl', 'x': time_points, 'y': system_health,
+                         'mode': 'lines+markers', 'name': 'System Health %',
+                         'line': {'color': 'green', 'width': 3}, 'yaxis': 'y2'}
+                    ],
+                    'layout': {
+                        'title': 'Attack vs Defense Simulation',
+                        'xaxis': {'title': 'Time (minutes)'},
+                        'yaxis': {'title': 'Power/Effectiveness'},
+                        'yaxis2': {'title': 'System Health %', 'overlaying': 'y', 'side': 'right'},
+                        'height': 400
+                    }
+                })
+
+                st.plotly_chart(fig, use_container_width=True,
+                                config={'displayModeBar': False})
+
                 # Simulation results
                 final_health = system_health[-1]
                 if final_health > 80:
@@ -268,19 +836,15 @@ class EducationalResources:
                         parents.append(category)
                         values.append(10)
                 
-                fig = go.Figure(go.Sunburst(
-                    labels=labels,
-                    parents=parents,
-                    values=values,
-                    branchvalues="total"
-                ))
+                fig = go.Figure({
+                    'data': [{'type': 'sunburst', 'labels': labels,
+                              'parents': parents, 'values': values,
+                              'branchvalues': 'total'}],
+                    'layout': {'title': 'DoS Attack Classification', 'height': 500}
+                })
                 
-                fig.update_layout(
-                    title="DoS Attack Classification",
-                    height=500
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True,
+                                config={'staticPlot': True, 'displayModeBar': False})
             
             elif chart_type == 'defense_layers':
                 st.markdown("**Defense in Depth Strategy**")
@@ -290,35 +854,24 @@ class EducationalResources:
                 effectiveness = [85, 75, 80, 70, 90]
                 complexity = [60, 70, 50, 80, 85]
                 
-                fig = go.Figure()
-                
-                fig.add_trace(go.Scatterpolar(
-                    r=effectiveness,
-                    theta=layers,
-                    fill='toself',
-                    name='Effectiveness %',
-                    line_color='blue'
-                ))
-                
-                fig.add_trace(go.Scatterpolar(
-                    r=complexity,
-                    theta=layers,
-                    fill='toself',
-                    name='Implementation Complexity %',
-                    line_color='red'
-                ))
-                
-                fig.update_layout(
-                    polar=dict(
-                        radialaxis=dict(
-                            visible=True,
-                            range=[0, 100]
-                        )),
-                    showlegend=True,
-                    title="Defense Strategy Analysis"
-                )
+                fig = go.Figure({
+                    'data': [
+                        {'type': 'scatterpolar', 'r': effectiveness, 'theta': layers,
+                         'fill': 'toself', 'name': 'Effectiveness %',
+                         'line': {'color': 'blue'}},
+                        {'type': 'scatterpolar', 'r': complexity, 'theta': layers,
+                         'fill': 'toself', 'name': 'Implementation Complexity %',
+                         'line': {'color': 'red'}}
+                    ],
+                    'layout': {
+                        'polar': {'radialaxis': {'visible': True, 'range': [0, 100]}},
+                        'showlegend': True,
+                        'title': 'Defense Strategy Analysis'
+                    }
+                })
                 
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True,
+                                config={'staticPlot': True, 'displayModeBar': False})
     
     def _render_interactive_guides(self):
         st.subheader("🎯 Interactive Guides")
@@ -340,68 +893,30 @@ class EducationalResources:
     def _render_detection_setup_guide(self):
         st.markdown("### 🔍 DoS Detection Setup Guide")
         
-        # Step-by-step guide
-        steps = [
-            {
-                'title': 'Baseline Establishment',
-                'description': 'Establish normal traffic patterns and system behavior',
-                'tasks': [
-                    'Monitor traffic for 2-4 weeks during normal operations',
-                    'Document peak usage times and patterns',
-                    'Record normal resource utilization levels',
-                    'Identify legitimate traffic sources and patterns'
-                ],
-                'tools': ['Network monitoring tools', 'SIEM systems', 'Traffic analyzers'],
-                'metrics': ['Requests per second', 'Bandwidth utilization', 'Connection counts']
-            },
-            {
-                'title': 'Threshold Configuration',
-                'description': 'Set appropriate detection thresholds based on baseline data',
-                'tasks': [
-                    'Calculate baseline statistics (mean, standard deviation)',
-                    'Set thresholds at 3-4 standard deviations above normal',
-                    'Configure rate-based detection rules',
-                    'Implement adaptive thresholds for time-of-day variations'
-                ],
-                'tools': ['Statistical analysis tools', 'Threshold calculators', 'Alert systems'],
-                'metrics': ['Threshold values', 'False positive rates', 'Detection sensitivity']
-            },
-            {
-                'title': 'Detection Rules',
-                'description': 'Implement comprehensive detection rules and signatures',
-                'tasks': [
-                    'Create traffic volume detection rules',
-                    'Implement protocol-specific signatures',
-                    'Configure behavioral analysis rules',
-                    'Set up geographic anomaly detection'
-                ],
-                'tools': ['IDS/IPS systems', 'Rule engines', 'Signature databases'],
-                'metrics': ['Rule coverage', 'Detection accuracy', 'Response time']
-            }
-        ]
+        steps = _DETECTION_STEPS
         
         # Interactive step progression
-        if 'guide_step' not in st.session_state:
-            st.session_state.guide_step = 0
+        st.session_state.setdefault('guide_step', 0)
         
         current_step = st.session_state.guide_step
-        
+        n_steps = len(steps)
+
         # Step navigation
         col1, col2, col3 = st.columns([1, 2, 1])
-        
+
         with col1:
             if st.button("⬅️ Previous", disabled=current_step == 0):
                 st.session_state.guide_step = max(0, current_step - 1)
                 st.rerun()
-        
+
         with col2:
-            st.markdown(f"**Step {current_step + 1} of {len(steps)}**")
-            progress = (current_step + 1) / len(steps)
+            st.markdown(f"**Step {current_step + 1} of {n_steps}**")
+            progress = (current_step + 1) / n_steps
             st.progress(progress)
-        
+
         with col3:
-            if st.button("Next ➡️", disabled=current_step == len(steps) - 1):
-                st.session_state.guide_step = min(len(steps) - 1, current_step + 1)
+            if st.button("Next ➡️", disabled=current_step == n_steps - 1):
+                st.session_state.guide_step = min(n_steps - 1, current_step + 1)
                 st.rerun()
         
         # Display current step
@@ -414,8 +929,11 @@ class EducationalResources:
         
         with col1:
             st.markdown("**Tasks to Complete**")
+            completed_count = 0
+            tprefix = f"task_{current_step}_"
             for i, task in enumerate(step_data['tasks']):
-                completed = st.checkbox(task, key=f"task_{current_step}_{i}")
+                if st.checkbox(task, key=tprefix + str(i)):
+                    completed_count += 1
         
         with col2:
             st.markdown("**Required Tools**")
@@ -426,11 +944,8 @@ class EducationalResources:
             for metric in step_data['metrics']:
                 st.write(f"• {metric}")
         
-        # Step completion check
-        all_tasks_completed = all([
-            st.session_state.get(f"task_{current_step}_{i}", False) 
-            for i in range(len(step_data['tasks']))
-        ])
+        # Step completion check - tallied while rendering the checkboxes
+        all_tasks_completed = completed_count == len(step_data['tasks'])
         
         if all_tasks_completed:
             st.success("✅ Step completed! You can proceed to the next step.")
@@ -439,68 +954,7 @@ class EducationalResources:
         st.markdown("### 🚨 Incident Response Guide")
         
         # Interactive incident response playbook
-        response_phases = {
-            'Detection & Analysis': {
-                'duration': '5-15 minutes',
-                'activities': [
-                    'Confirm attack detection',
-                    'Classify attack type and severity',
-                    'Assess immediate impact',
-                    'Activate incident response team'
-                ],
-                'tools': ['Monitoring dashboards', 'Alert systems', 'Analysis tools'],
-                'decisions': [
-                    'Is this a confirmed DoS attack?',
-                    'What is the attack severity level?',
-                    'Which systems are affected?'
-                ]
-            },
-            'Containment': {
-                'duration': '15-30 minutes',
-                'activities': [
-                    'Implement traffic filtering',
-                    'Activate DDoS protection services',
-                    'Block malicious sources',
-                    'Reroute traffic if necessary'
-                ],
-                'tools': ['Firewalls', 'DDoS protection', 'Load balancers'],
-                'decisions': [
-                    'Should we block specific IP ranges?',
-                    'Do we need to activate cloud protection?',
-                    'Should traffic be rerouted?'
-                ]
-            },
-            'Eradication': {
-                'duration': '30-60 minutes',
-                'activities': [
-                    'Eliminate attack sources',
-                    'Patch vulnerabilities',
-                    'Update security rules',
-                    'Strengthen defenses'
-                ],
-                'tools': ['Security tools', 'Patch management', 'Configuration tools'],
-                'decisions': [
-                    'Are all attack vectors eliminated?',
-                    'Do we need immediate patches?',
-                    'What rules need updating?'
-                ]
-            },
-            'Recovery': {
-                'duration': '1-4 hours',
-                'activities': [
-                    'Restore affected services',
-                    'Verify system integrity',
-                    'Monitor for attack resumption',
-                    'Communicate with stakeholders'
-                ],
-                'tools': ['Backup systems', 'Monitoring tools', 'Communication systems'],
-                'decisions': [
-                    'Are services fully operational?',
-                    'Is monitoring adequate?',
-                    'When to communicate all-clear?'
-                ]
-            }
-        }
+        response_phases = _RESPONSE_PHASES
         
         # Phase selection
         selected_phase = st.selectbox("Select Response Phase", list(response_phases.keys()))
@@ -537,52 +991,26 @@ class EducationalResources:
     def _render_network_hardening_guide(self):
         st.markdown("### 🔒 Network Hardening Guide")
         
-        hardening_categories = {
-            'Network Perimeter': [
-                'Configure firewall rules to block unnecessary traffic',
-                'Implement ingress and egress filtering',
-                'Set up intrusion detection/prevention systems',
-                'Enable DDoS protection services'
-            ],
-            'Rate Limiting': [
-                'Configure connection rate limits',
-                'Implement bandwidth throttling',
-                'Set up request rate limiting',
-                'Configure concurrent connection limits'
-            ],
-            'Protocol Security': [
-                'Disable unnecessary network services',
-                'Secure routing protocols',
-                'Implement source address validation',
-                'Configure protocol-specific protections'
-            ],
-            'Monitoring & Logging': [
-                'Enable comprehensive network logging',
-                'Set up real-time monitoring',
-                'Configure automated alerting',
-                'Implement traffic analysis tools'
-            ]
-        }
+        hardening_categories = _HARDENING_CATEGORIES
         
-        # Category selection and progress tracking
+        # Category selection and progress tracking - the overall total is
+        # tallied here too, avoiding a second pass of session_state lookups
+        total_items = 0
+        completed_total = 0
         for category, items in hardening_categories.items():
             with st.expander(f"🛡️ {category}"):
                 completed_items = 0
-                
+
+                hprefix = f"hardening_{category}_"
                 for i, item in enumerate(items):
-                    if st.checkbox(item, key=f"hardening_{category}_{i}"):
+                    if st.checkbox(item, key=hprefix + str(i)):
                         completed_items += 1
-                
+
                 progress = completed_items / len(items)
                 st.progress(progress, f"Progress: {completed_items}/{len(items)} items completed")
-        
-        # Overall hardening score
-        total_items = sum(len(items) for items in hardening_categories.values())
-        completed_total = sum([
-            1 for category, items in hardening_categories.items()
-            for i in range(len(items))
-            if st.session_state.get(f"hardening_{category}_{i}", False)
-        ])
+
+            total_items += len(items)
+            completed_total += completed_items
         
         overall_progress = completed_total / total_items
         
@@ -615,20 +1043,17 @@ class EducationalResources:
         with col1:
             st.markdown("**Infrastructure Assessment**")
             
-            network_size = st.selectbox(
-                "Network Size",
-                ["Small (< 100 devices)", "Medium (100-1000 devices)", "Large (1000+ devices)"]
-            )
+            network_size = _NETWORK_SIZE_LABELS[st.selectbox(
+                "Network Size", tuple(_NETWORK_SIZE_LABELS)
+            )]
             
-            traffic_volume = st.selectbox(
-                "Daily Traffic Volume",
-                ["Low (< 1GB)", "Medium (1-10GB)", "High (10-100GB)", "Very High (> 100GB)"]
-            )
+            traffic_volume = _TRAFFIC_VOLUME_LABELS[st.selectbox(
+                "Daily Traffic Volume", tuple(_TRAFFIC_VOLUME_LABELS)
+            )]
             
-            criticality = st.selectbox(
-                "Service Criticality",
-                ["Low", "Medium", "High", "Critical"]
-            )
+            criticality = _CRITICALITY_LABELS[st.selectbox(
+                "Service Criticality", tuple(_CRITICALITY_LABELS)
+            )]
         
         with col2:
             st.markdown("**Monitoring Recommendations**")
@@ -643,16 +1068,7 @@ class EducationalResources:
         st.markdown("---")
         st.markdown("**Monitoring Implementation Checklist**")
         
-        monitoring_tasks = [
-            "Install network monitoring software",
-            "Configure SNMP monitoring for devices",
-            "Set up traffic flow analysis",
-            "Implement log collection and analysis",
-            "Configure real-time alerting",
-            "Create monitoring dashboards",
-            "Test alert mechanisms",
-            "Document monitoring procedures"
-        ]
+        monitoring_tasks = _MONITORING_TASKS
         
         completed_tasks = 0
         for i, task in enumerate(monitoring_tasks):
@@ -682,10 +1098,9 @@ class EducationalResources:
     def _render_quick_quiz(self):
         st.markdown("### ⚡ Quick Knowledge Quiz")
         
-        if 'quiz_started' not in st.session_state:
-            st.session_state.quiz_started = False
-            st.session_state.quiz_answers = {}
-            st.session_state.current_question = 0
+        st.session_state.setdefault('quiz_started', False)
+        st.session_state.setdefault('quiz_answers', {})
+        st.session_state.setdefault('current_question', 0)
         
         if not st.session_state.quiz_started:
             st.write("Test your knowledge of DoS attacks and defenses with this quick quiz.")
@@ -696,12 +1111,13 @@ class EducationalResources:
         
         # Quiz questions
         questions = self.quiz_questions['quick_quiz']
+        n_questions = len(questions)
         current_q = st.session_state.current_question
-        
-        if current_q < len(questions):
+
+        if current_q < n_questions:
             question = questions[current_q]
-            
-            st.markdown(f"**Question {current_q + 1} of {len(questions)}**")
+
+            st.markdown(f"**Question {current_q + 1} of {n_questions}**")
             st.write(question['question'])
             
             answer = st.radio(
@@ -718,9 +1134,9 @@ class EducationalResources:
                     st.rerun()
             
             with col2:
-                if st.button("Next" if current_q < len(questions) - 1 else "Finish"):
+                if st.button("Next" if current_q < n_questions - 1 else "Finish"):
                     st.session_state.quiz_answers[current_q] = answer
-                    if current_q < len(questions) - 1:
+                    if current_q < n_questions - 1:
                         st.session_state.current_question += 1
                     else:
                         st.session_state.current_question += 1  # Move to results
@@ -732,22 +1148,32 @@ class EducationalResources:
     
     def _show_quiz_results(self, questions, answers):
         st.markdown("### 📊 Quiz Results")
-        
-        correct_answers = 0
+
         total_questions = len(questions)
-        
-        for i, question in enumerate(questions):
-            user_answer = answers.get(i, "")
-            correct = user_answer == question['correct_answer']
-            
-            if correct:
-                correct_answers += 1
-            
-            with st.expander(f"Question {i+1} - {'✅' if correct else '❌'}"):
-                st.write(f"**Question**: {question['question']}")
-                st.write(f"**Your Answer**: {user_answer}")
-                st.write(f"**Correct Answer**: {question['correct_answer']}")
-                st.write(f"**Explanation**: {question['explanation']}")
+
+        # Grade in one pass, separate from rendering, so the review loop can
+        # be skipped entirely in summary-only mode
+        correct_flags = [
+            answers.get(i, "") == q['correct_answer'] for i, q in enumerate(questions)
+        ]
+        correct_answers = sum(correct_flags)
+
+        if st.checkbox("Show detailed review", value=True, key="show_details"):
+            # One markdown block for the whole review: <details> gives
+            # client-side collapsibility without a Streamlit expander + 4
+            # writes per question
+            review_blocks = []
+            for i, question in enumerate(questions):
+                user_answer = answers.get(i, "")
+                review_blocks.append(
+                    f"<details><summary>Question {i+1} - {'✅' if correct_flags[i] else '❌'}</summary>"
+                    f"<p><b>Question</b>: {question['question']}<br>"
+                    f"<b>Your Answer</b>: {user_answer}<br>"
+                    f"<b>Correct Answer</b>: {question['correct_answer']}<br>"
+                    f"<b>Explanation</b>: {question['explanation']}</p>"
+                    f"</details>"
+                )
+            st.markdown("\n".join(review_blocks), unsafe_allow_html=True)
         
         # Overall score
         score_percentage = (correct_answers / total_questions) * 100
@@ -761,18 +1187,8 @@ class EducationalResources:
             st.metric("Percentage", f"{score_percentage:.1f}%")
         
         with col3:
-            if score_percentage >= 80:
-                grade = "Excellent"
-                color = "green"
-            elif score_percentage >= 70:
-                grade = "Good"
-                color = "blue"
-            elif score_percentage >= 60:
-                grade = "Fair"
-                color = "orange"
-            else:
-                grade = "Needs Improvement"
-                color = "red"
+            idx = bisect.bisect_right(_GRADE_THRESHOLDS, score_percentage)
+            _, grade, color = _GRADE_TABLE[idx]
             
             st.markdown(f"**Grade**: :{color}[{grade}]")
         
@@ -786,34 +1202,9 @@ class EducationalResources:
     def _render_scenario_analysis(self):
         st.markdown("### 🎭 Scenario Analysis")
         
-        scenarios = [
-            {
-                'title': 'E-commerce Site Under Attack',
-                'description': 'Your e-commerce website is experiencing a sudden 10x increase in traffic during Black Friday sales.',
-                'context': 'Peak shopping day, high legitimate traffic expected, revenue critical',
-                'indicators': ['Response time degradation', 'Database connection timeouts', 'Payment processing failures'],
-                'questions': [
-                    'How would you differentiate between legitimate shopping traffic and a DoS attack?',
-                    'What immediate actions would you take to maintain service availability?',
-                    'How would you communicate with customers during the incident?'
-                ]
-            },
-            {
-                'title': 'Financial Services DDoS',
-                'description': 'A banking application is under a sophisticated DDoS attack affecting online banking services.',
-                'context': 'Critical financial services, regulatory compliance required, customer trust at stake',
-                'indicators': ['Login failures', 'Transaction timeouts', 'Mobile app connectivity issues'],
-                'questions': [
-                    'What are your priorities for service restoration?',
-                    'How would you handle regulatory reporting requirements?',
-                    'What communication strategy would you implement?'
-                ]
-            }
-        ]
-        
-        selected_scenario = st.selectbox("Select Scenario", [s['title'] for s in scenarios])
-        
-        scenario = next(s for s in scenarios if s['title'] == selected_scenario)
+        selected_scenario = st.selectbox("Select Scenario", _SCENARIO_TITLES)
+
+        scenario = _SCENARIOS_BY_TITLE[selected_scenario]
         
         st.markdown(f"### {scenario['title']}")
         st.write(scenario['description'])
@@ -826,24 +1217,29 @@ class EducationalResources:
             st.write(f"• {indicator}")
         
         st.markdown("**Analysis Questions**")
+        fprefix = f"scenario_form_{selected_scenario}_"
+        sprefix = f"scenario_{selected_scenario}_"
         for i, question in enumerate(scenario['questions']):
             with st.expander(f"Question {i+1}"):
                 st.write(question)
-                response = st.text_area(
-                    "Your response:",
-                    key=f"scenario_{selected_scenario}_{i}",
-                    height=100
-                )
-                
-                if response and st.button(f"Get Feedback", key=f"feedback_{selected_scenario}_{i}"):
+                # Form batches typing and submission into a single rerun
+                # instead of one per keystroke-commit plus one per click
+                with st.form(key=fprefix + str(i)):
+                    response = st.text_area(
+                        "Your response:",
+                        key=sprefix + str(i),
+                        height=100
+                    )
+                    submitted = st.form_submit_button("Get Feedback")
+
+                if submitted and response:
                     feedback = self._generate_scenario_feedback(question, response)
                     st.info(f"💡 **Feedback**: {feedback}")
     
     def _render_practical_exercises(self):
         st.subheader("🛠️ Practical Exercises")
         
-        exercise_names = list(self.practical_exercises.keys())
-        selected_exercise = st.selectbox("Select Exercise", exercise_names)
+        selected_exercise = st.selectbox("Select Exercise", self.exercise_names)
         
         if selected_exercise:
             exercise = self.practical_exercises[selected_exercise]
@@ -856,21 +1252,28 @@ class EducationalResources:
                 st.write(f"• {objective}")
             
             st.markdown("**Exercise Steps**")
-            for i, step in enumerate(exercise['steps']):
-                with st.expander(f"Step {i+1}: {step['title']}"):
-                    st.write(step['instruction'])
-                    
-                    if 'code' in step:
-                        st.code(step['code'], language=step.get('language', 'text'))
-                    
-                    completed = st.checkbox(f"Mark step {i+1} complete", key=f"exercise_{selected_exercise}_step_{i}")
-            
-            # Exercise completion
+            # One form batches every step checkbox into a single
+            # save-progress rerun instead of one rerun per toggle
+            with st.form(f"exercise_form_{selected_exercise}"):
+                eprefix = f"exercise_{selected_exercise}_step_"
+                step_checks = []
+                for i, step in enumerate(exercise['steps']):
+                    with st.expander(f"Step {i+1}: {step['title']}"):
+                        st.write(step['instruction'])
+
+                        if 'code' in step:
+                            st.code(step['code'], language=step.get('language', 'text'))
+
+                        step_checks.append(st.checkbox(
+                            f"Mark step {i+1} complete",
+                            key=eprefix + str(i)
+                        ))
+
+                st.form_submit_button("Save Progress")
+
+            # Exercise completion - from the submitted checkbox values
             total_steps = len(exercise['steps'])
-            completed_steps = sum([
-                1 for i in range(total_steps)
-                if st.session_state.get(f"exercise_{selected_exercise}_step_{i}", False)
-            ])
+            completed_steps = sum(step_checks)
             
             progress = completed_steps / total_steps
             st.progress(progress, f"Exercise Progress: {completed_steps}/{total_steps} steps completed")
@@ -880,357 +1283,105 @@ class EducationalResources:
     
     def _render_reference_materials(self):
         st.subheader("📚 Reference Materials")
-        
-        reference_tabs = st.tabs(["Standards & Frameworks", "Best Practices", "Tools & Resources", "Glossary"])
-        
-        with reference_tabs[0]:
-            st.markdown("### 📋 Standards & Frameworks")
-            
-            standards = {
-                'NIST Cybersecurity Framework': {
-                    'description': 'Framework for improving critical infrastructure cybersecurity',
-                    'relevance': 'Identify, Protect, Detect, Respond, Recover phases for DoS incidents',
-                    'link': 'https://www.nist.gov/cyberframework'
-                },
-                'ISO 27001': {
-                    'description': 'Information security management systems standard',
-                    'relevance': 'Risk management and security controls for DoS protection',
-                    'link': 'https://www.iso.org/isoiec-27001-information-security.html'
-                },
-                'OWASP Security Guidelines': {
-                    'description': 'Open Web Application Security Project guidelines',
-                    'relevance': 'Application-layer DoS protection and mitigation techniques',
-                    'link': 'https://owasp.org/'
-                }
-            }
-            
-            for standard, info in standards.items():
-                with st.expander(standard):
-                    st.write(f"**Description**: {info['description']}")
-                    st.write(f"**DoS Relevance**: {info['relevance']}")
-                    st.write(f"**Reference**: {info['link']}")
-        
-        with reference_tabs[1]:
-            st.markdown("### ✅ Best Practices")
-            
-            best_practices = {
-                'Prevention': [
-                    'Implement network segmentation and access controls',
-                    'Use rate limiting and traffic shaping',
-                    'Deploy DDoS protection services',
-                    'Regular security assessments and penetration testing'
-                ],
-                'Detection': [
-                    'Establish baseline traffic patterns',
-                    'Implement real-time monitoring and alerting',
-                    'Use behavioral analysis and anomaly detection',
-                    'Deploy intrusion detection/prevention systems'
-                ],
-                'Response': [
-                    'Develop and test incident response procedures',
-                    'Maintain communication plans and contact lists',
-                    'Practice regular incident response drills',
-                    'Document all incidents for lessons learned'
-                ],
-                'Recovery': [
-                    'Implement robust backup and recovery procedures',
-                    'Test disaster recovery plans regularly',
-                    'Maintain business continuity plans',
-                    'Conduct post-incident reviews and improvements'
-                ]
-            }
-            
-            for category, practices in best_practices.items():
-                st.markdown(f"**{category}**")
-                for practice in practices:
-                    st.write(f"• {practice}")
-                st.markdown("---")
-        
-        with reference_tabs[2]:
-            st.markdown("### 🛠️ Tools & Resources")
-            
-            tools = {
-                'Open Source': [
-                    'Wireshark - Network protocol analyzer',
-                    'Nagios - Network monitoring',
-                    'Suricata - Network IDS/IPS',
-                    'pfSense - Firewall and router'
-                ],
-                'Commercial': [
-                    'Cloudflare - DDoS protection service',
-                    'Arbor Networks - DDoS protection',
-                    'F5 - Application delivery controllers',
-                    'Radware - DDoS protection solutions'
-                ],
-                'Cloud Services': [
-                    'AWS Shield - DDoS protection',
-                    'Azure DDoS Protection - Microsoft cloud protection',
-                    'Google Cloud Armor - Google cloud security',
-                    'Cloudflare - Global DDoS protection'
-                ]
-            }
-            
-            for category, tool_list in tools.items():
-                st.markdown(f"**{category} Tools**")
-                for tool in tool_list:
-                    st.write(f"• {tool}")
-                st.markdown("---")
-        
-        with reference_tabs[3]:
-            st.markdown("### 📖 Glossary")
-            
-            glossary_terms = {
-                'DDoS': 'Distributed Denial of Service - attack using multiple compromised systems',
-                'Botnet': 'Network of compromised computers controlled remotely',
-                'Amplification': 'Attack technique that leverages servers to multiply attack traffic',
-                'Rate Limiting': 'Controlling the rate of requests to prevent overload',
-                'SYN Flood': 'Attack that exploits TCP handshake process',
-                'Volumetric Attack': 'Attack designed to consume bandwidth or system resources',
-                'Protocol Attack': 'Attack that exploits weaknesses in network protocols',
-                'Application Layer Attack': 'Attack targeting specific applications or services'
-            }
-            
-            for term, definition in glossary_terms.items():
-                with st.expander(term):
-                    st.write(definition)
+
+        # A radio instead of st.tabs: tabs execute every section's block on
+        # every rerun, while this renders only the selected section
+        active = st.radio(
+            "Section",
+            ["Standards & Frameworks", "Best Practices", "Tools & Resources", "Glossary"],
+            horizontal=True,
+            key="ref_tab"
+        )
+
+        # Each section is one cached, pre-joined markdown string; collapsible
+        # entries use client-side <details> blocks so the whole section costs
+        # a single widget instead of dozens
+        if active == "Standards & Frameworks":
+            st.markdown(_standards_md(), unsafe_allow_html=True)
+        elif active == "Best Practices":
+            st.markdown(_best_practices_md())
+        elif active == "Tools & Resources":
+            st.markdown(_tools_md())
+        elif active == "Glossary":
+            st.markdown(_glossary_md(), unsafe_allow_html=True)
     
     def _get_learning_modules(self):
         """Define learning modules structure"""
-        return {
-            'DoS Fundamentals': {
-                'description': 'Introduction to Denial of Service attacks',
-                'duration': '2 hours',
-                'sections': {
-                    'What are DoS Attacks?': {
-                        'type': 'text',
-                        'objectives': [
-                            'Understand the definition and purpose of DoS attacks',
-                            'Distinguish between DoS and DDoS attacks',
-                            'Identify common attack motivations'
-                        ],
-                        'content': """
-                        **Denial of Service (DoS) Attacks Overview**
-                        
-                        A Denial of Service attack is a malicious attempt to disrupt the normal traffic of a targeted server, 
-                        service, or network by overwhelming the target or its surrounding infrastructure with a flood of Internet traffic.
-                        
-                        **Key Characteristics:**
-                        - Designed to make services unavailable to legitimate users
-                        - Can target network bandwidth, system resources, or application logic
-                        - Range from simple to highly sophisticated attacks
-                        
-                        **DoS vs DDoS:**
-                        - **DoS**: Attack from a single source
-                        - **DDoS**: Distributed attack from multiple sources (more common and effective)
-                        
-                        **Common Motivations:**
-                        - Financial gain (extortion, competitive advantage)
-                        - Political activism (hacktivism)
-                        - Personal grievances
-                        - Testing and research (educational/defensive)
-                        """,
-                        'key_concepts': {
-                            'Availability': 'One of the CIA triad - ensuring services remain accessible to authorized users',
-                            'Traffic Flood': 'Overwhelming a target with more requests than it can handle',
-                            'Resource Exhaustion': 'Consuming system resources like CPU, memory, or network connections'
-                        },
-                        'practice_questions': [
-                            {
-                                'question': 'What is the main goal of a DoS attack?',
-                                'options': ['Steal data', 'Make services unavailable', 'Gain system access', 'Install malware'],
-                                'correct_answer': 'Make services unavailable',
-                                'explanation': 'DoS attacks specifically aim to deny service availability to legitimate users.'
-                            }
-                        ]
-                    },
-                    'Attack Categories': {
-                        'type': 'visualization',
-                        'objectives': [
-                            'Classify different types of DoS attacks',
-                            'Understand attack vector characteristics',
-                            'Identify appropriate defenses for each category'
-                        ],
-                        'content': {
-                            'chart_type': 'attack_taxonomy'
-                        }
-                    },
-                    'Defense Strategies': {
-                        'type': 'visualization',
-                        'objectives': [
-                            'Learn defense-in-depth approaches',
-                            'Understand layered security models',
-                            'Evaluate defense effectiveness'
-                        ],
-                        'content': {
-                            'chart_type': 'defense_layers'
-                        }
-                    }
-                }
-            },
-            'Attack Vectors': {
-                'description': 'Detailed study of DoS attack methodologies',
-                'duration': '3 hours',
-                'sections': {
-                    'Volumetric Attacks': {
-                        'type': 'text',
-                        'content': """
-                        **Volumetric Attacks Overview**
-                        
-                        Volumetric attacks aim to overwhelm the target's bandwidth or consume network resources.
-                        These attacks focus on generating high volumes of traffic to saturate network links.
-                        
-                        **Common Types:**
-                        - UDP Floods
-                        - ICMP Floods  
-                        - Amplification attacks (DNS, NTP, Memcached)
-                        
-                        **Characteristics:**
-                        - High bandwidth consumption
-                        - Network infrastructure targeting
-                        - Measurable in bits per second (bps)
-                        """,
-                        'key_concepts': {
-                            'Bandwidth Saturation': 'Filling network pipes with malicious traffic',
-                            'Amplification Factor': 'Ratio of response size to request size in reflection attacks'
-                        }
-                    }
-                }
-            }
-        }
+        return _LEARNING_MODULES
     
     def _get_quiz_questions(self):
         """Define quiz questions for assessments"""
-        return {
-            'quick_quiz': [
-                {
-                    'question': 'Which type of DoS attack uses multiple compromised systems?',
-                    'options': ['DoS', 'DDoS', 'UDP Flood', 'SYN Flood'],
-                    'correct_answer': 'DDoS',
-                    'explanation': 'DDoS (Distributed Denial of Service) attacks use multiple compromised systems to attack a target.'
-                },
-                {
-                    'question': 'What is the primary goal of rate limiting as a defense mechanism?',
-                    'options': ['Block all traffic', 'Control request frequency', 'Encrypt traffic', 'Monitor logs'],
-                    'correct_answer': 'Control request frequency',
-                    'explanation': 'Rate limiting controls the frequency of requests to prevent system overload.'
-                },
-                {
-                    'question': 'Which attack vector targets the TCP handshake process?',
-                    'options': ['UDP Flood', 'SYN Flood', 'HTTP Flood', 'ICMP Flood'],
-                    'correct_answer': 'SYN Flood',
-                    'explanation': 'SYN Flood attacks exploit the TCP three-way handshake by sending many SYN requests without completing the handshake.'
-                }
-            ]
-        }
+        return _QUIZ_QUESTIONS
     
     def _get_practical_exercises(self):
         """Define practical exercises"""
-        return {
-            'Traffic Analysis': {
-                'title': 'Network Traffic Analysis Exercise',
-                'description': 'Learn to identify DoS attack patterns in network traffic',
-                'objectives': [
-                    'Analyze network traffic patterns',
-                    'Identify anomalous behavior',
-                    'Calculate baseline metrics'
-                ],
-                'steps': [
-                    {
-                        'title': 'Establish Baseline',
-                        'instruction': 'Calculate normal traffic baseline from sample data',
-                        'code': '''
-# Sample traffic analysis
-import pandas as pd
-import numpy as np
-
-# Load traffic data
-traffic_data = pd.read_csv('traffic_sample.csv')
-
-# Calculate baseline metrics
-baseline_rps = traffic_data['requests_per_second'].mean()
-baseline_std = traffic_data['requests_per_second'].std()
-
-print(f"Baseline RPS: {baseline_rps:.2f}")
-print(f"Standard Deviation: {baseline_std:.2f}")
-print(f"Upper threshold: {baseline_rps + 3*baseline_std:.2f}")
-                        ''',
-                        'language': 'python'
-                    },
-                    {
-                        'title': 'Anomaly Detection',
-                        'instruction': 'Implement simple anomaly detection algorithm'
-                    }
-                ]
-            }
-        }
+        return _PRACTICAL_EXERCISES
     
-    def _generate_monitoring_recommendations(self, network_size, traffic_volume, criticality):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _generate_monitoring_recommendations(network_size, traffic_volume, criticality):
         """Generate monitoring recommendations based on requirements"""
-        recommendations = []
-        
-        if "Large" in network_size:
-            recommendations.append("Deploy distributed monitoring infrastructure")
-            recommendations.append("Implement centralized log aggregation")
-        
-        if "High" in traffic_volume or "Very High" in traffic_volume:
-            recommendations.append("Use high-performance monitoring tools")
-            recommendations.append("Implement traffic sampling for analysis")
-        
-        if criticality in ["High", "Critical"]:
-            recommendations.append("Set up 24/7 monitoring with immediate alerting")
-            recommendations.append("Implement redundant monitoring systems")
-        
-        return recommendations
+        return tuple(
+            rec for cond, rec in _MONITORING_RULES
+            if cond(network_size, traffic_volume, criticality)
+        )
     
     def _generate_scenario_feedback(self, question, response):
         """Generate feedback for scenario analysis responses"""
-        feedback_templates = {
-            'differentiate': 'Consider analyzing traffic patterns, source IP distributions, and user behavior patterns to distinguish legitimate from malicious traffic.',
-            'immediate actions': 'Focus on preserving critical functionality, implementing traffic controls, and activating incident response procedures.',
-            'communication': 'Develop clear, honest communication that maintains customer confidence while providing necessary information.'
-        }
-        
-        # Simple keyword matching for feedback
-        for key, feedback in feedback_templates.items():
-            if key in question.lower():
-                return feedback
-        
-        return 'Good analysis. Consider the technical, business, and communication aspects of your response.'
+        # Single compiled-regex scan instead of per-keyword substring loops
+        match = _FEEDBACK_RE.search(question)
+        if match:
+            return _FEEDBACK_MAP[match.group(0).lower()]
+        return _DEFAULT_FEEDBACK
     
     def _generate_section_notes(self, module_name, section_name, section_data):
         """Generate downloadable section notes"""
-        notes = f"""
+        # Section content is static, so the body is memoized by name;
+        # only the dated footer is rebuilt per download
+        key = (module_name, section_name)
+        body = _NOTES_CACHE.get(key)
+        if body is None:
+            body = _NOTES_CACHE[key] = self._build_notes_body(
+                module_name, section_name, section_data
+            )
+
+        return body + f"""
+
+Generated by DoS Attack Analysis & Education Platform
+Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+"""
+
+    @staticmethod
+    def _build_notes_body(module_name, section_name, section_data):
+        # Accumulate parts and join once - repeated += on a growing string
+        # copies the whole buffer each time
+        parts = [f"""
 {module_name.upper()} - {section_name.upper()}
 {'='*50}
 
 LEARNING OBJECTIVES:
-"""
-        
+"""]
+        append = parts.append
+
         if 'objectives' in section_data:
             for obj in section_data['objectives']:
-                notes += f"• {obj}\n"
-        
-        notes += f"""
+                append(f"• {obj}\n")
+
+        append(f"""
 CONTENT:
 {'-'*20}
-"""
-        
+""")
+
         if isinstance(section_data.get('content'), str):
-            notes += section_data['content']
-        
+            append(section_data['content'])
+
         if 'key_concepts' in section_data:
-            notes += f"""
+            append(f"""
 
 KEY CONCEPTS:
 {'-'*20}
-"""
+""")
             for concept, definition in section_data['key_concepts'].items():
-                notes += f"{concept}: {definition}\n"
-        
-        notes += f"""
+                append(f"{concept}: {definition}\n")
 
-Generated by DoS Attack Analysis & Education Platform
-Date: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        
-        return notes
+        return "".join(parts)